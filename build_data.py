@@ -8,24 +8,62 @@ then assembles dashboard_v7.html from components.
 Usage:
     python3 build_data.py              # One-time build
     python3 build_data.py --watch      # Watch for changes, auto-rebuild
-    python3 build_data.py --watch -i 15  # Custom interval (seconds)
+    python3 build_data.py --watch -i 15  # Custom debounce / poll interval (seconds)
+
+Excel reader: python-calamine if installed (much faster), else openpyxl.
+Aggregation uses pandas if installed, else a Numba-compiled loop if numba
+is installed, else a pure-Python loop. JSON is written with orjson if installed.
+Watch mode uses watchdog file-system events if installed, else mtime polling.
 """
 
+import io
 import os
 import sys
 import json
 import time
 import shutil
-import tempfile
 import argparse
+import threading
 import subprocess
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
 from collections import defaultdict
+from functools import lru_cache
+from itertools import chain
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
 
 try:
     import openpyxl
 except ImportError:
-    print("ERROR: openpyxl not installed. Run: pip install openpyxl")
+    openpyxl = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = Observer = None
+
+if CalamineWorkbook is None and openpyxl is None:
+    print("ERROR: no Excel reader installed. Run: pip install python-calamine (or openpyxl)")
     sys.exit(1)
 
 # === PATHS ===
@@ -41,6 +79,9 @@ JS_PATH = os.path.join(SCRIPT_DIR, "new_js.txt")
 LEADERS_DIR = os.path.expanduser("~/Library/CloudStorage/OneDrive-AscorpSP/Leaders Dashboards")
 LEADERS_HTML = os.path.join(LEADERS_DIR, "teams-customers-dashboard.html")
 
+# Buffer size for dashboard/JSON file I/O (fewer read/write syscalls)
+IO_BUFFER = 1 << 20
+
 # === CONFIGURATION ===
 
 # Sheet name → subgroup configuration
@@ -67,6 +108,9 @@ MONTH_NAMES = {
     9: 'сентябрь', 10: 'октябрь', 11: 'ноябрь', 12: 'декабрь',
 }
 MONTH_NAME_TO_NUM = {v: k for k, v in MONTH_NAMES.items()}
+# Month cell as typed in the sheets → month name ('январь' and 'Январь' forms)
+MONTH_LOOKUP = {k: k for k in MONTH_NAME_TO_NUM}
+MONTH_LOOKUP.update({k.capitalize(): k for k in MONTH_NAME_TO_NUM})
 
 # Russian production calendar: working days per month
 PROD_CALENDAR = {
@@ -96,6 +140,14 @@ HEADER_MAP = {
     'тзт': 'tzt',
 }
 
+# Per-record numeric fields summed by aggregate()
+SUM_FIELDS = ['tzt', 'tk_b', 'ts_b', 'tk_r', 'ts_r', 'vz']
+SUM_SLOT = {f: i for i, f in enumerate(SUM_FIELDS)}
+TS_R_SLOT, VZ_SLOT = SUM_SLOT['ts_r'], SUM_SLOT['vz']
+
+# Columns of the daily dataset (stored column-wise, see pack_daily())
+DAILY_FIELDS = ['e', 'sg', 'g', 'd', 'm'] + SUM_FIELDS
+
 # Row labels to skip in operational data
 SKIP_NAMES = {
     'итого', 'беклог', 'сотрудники', '',
@@ -107,36 +159,85 @@ SKIP_NAMES = {
 
 # === HELPERS ===
 
+class CalamineBook:
+    """Workbook backed by python-calamine (Rust reader).
+
+    Cells are normalized to what openpyxl returns: calamine gives empty cells
+    as '' and every number as float, so '' becomes None and whole floats int
+    (a team cell 1 must print as '1', not '1.0'). Dates come back as date/datetime.
+    """
+
+    def __init__(self, f):
+        self._wb = CalamineWorkbook.from_filelike(f)
+        self.sheetnames = self._wb.sheet_names
+
+    def sheet_rows(self, name):
+        """All rows of a sheet from A1, so a cell at (r, c) is rows[r - 1][c - 1]."""
+        rows = self._wb.get_sheet_by_name(name).to_python(skip_empty_area=False)
+        return [
+            [None if v == '' else int(v) if type(v) is float and v.is_integer() else v
+             for v in row]
+            for row in rows
+        ]
+
+    def close(self):
+        self._wb.close()
+
+
+class OpenpyxlBook:
+    """Workbook backed by openpyxl in read-only mode (fallback reader)."""
+
+    def __init__(self, f):
+        self._wb = openpyxl.load_workbook(f, data_only=True, read_only=True)
+        self.sheetnames = self._wb.sheetnames
+
+    def sheet_rows(self, name):
+        """Read a sheet in one pass as a list of value tuples.
+
+        Rows are padded to the same width, so a cell at (r, c) is rows[r - 1][c - 1].
+        Dimensions are reset first: a stale <dimension> tag in read-only mode
+        would otherwise truncate the sheet.
+        """
+        ws = self._wb[name]
+        ws.reset_dimensions()
+        rows = [tuple(row) for row in ws.iter_rows(values_only=True)]
+        width = max((len(row) for row in rows), default=0)
+        return [row + (None,) * (width - len(row)) for row in rows]
+
+    def close(self):
+        self._wb.close()
+
+
 def safe_load_workbook(path, max_retries=3, retry_delay=5):
-    """Load Excel workbook via a temporary copy for safety.
+    """Load Excel workbook from an in-memory copy for safety.
 
-    Copies the file to a temp location before reading to avoid any interaction
-    with the original file (OneDrive sync, Excel locks, etc.).
+    Reads the file's bytes in one pass and parses them from memory, so the
+    reader never holds the original open (OneDrive sync, Excel locks, etc.).
+    Returns a CalamineBook or OpenpyxlBook; read sheets via sheet_rows()
+    and close() the workbook when done.
     Retries on failure (e.g. file being synced).
     """
     for attempt in range(1, max_retries + 1):
-        tmp_path = None
         try:
-            tmp_fd, tmp_path = tempfile.mkstemp(suffix='.xlsx')
-            os.close(tmp_fd)
-            shutil.copy2(path, tmp_path)
-            wb = openpyxl.load_workbook(tmp_path, data_only=True)
-            return wb
+            with open(path, 'rb') as f:
+                buf = io.BytesIO(f.read())
+            if CalamineWorkbook is not None:
+                return CalamineBook(buf)
+            return OpenpyxlBook(buf)
         except Exception as e:
             if attempt < max_retries:
                 print(f"  Retry {attempt}/{max_retries} loading {os.path.basename(path)}: {e}")
                 time.sleep(retry_delay)
             else:
                 raise
-        finally:
-            if tmp_path and os.path.exists(tmp_path):
-                try:
-                    os.unlink(tmp_path)
-                except OSError:
-                    pass
 
 
 def safe_float(v):
+    t = type(v)
+    if t is float:
+        return v
+    if t is int:
+        return float(v)
     if v is None:
         return 0.0
     if isinstance(v, (int, float)):
@@ -148,47 +249,77 @@ def safe_float(v):
 
 
 def safe_int(v):
+    if type(v) is int:
+        return v
     return int(round(safe_float(v)))
 
 
+def safe_tzt(v):
+    return round(safe_float(v), 2)
+
+
 def parse_date(s):
     if not s:
         return None
+    if isinstance(s, datetime):
+        return s
+    if isinstance(s, date):
+        return datetime(s.year, s.month, s.day)
+    # DD.MM.YYYY by hand (accepting what strptime's %d.%m.%Y does): several
+    # times faster than strptime. Strings with digits at both ends need no strip.
+    if type(s) is not str or not (s[0].isdigit() and s[-1].isdigit()):
+        s = str(s).strip()
     try:
-        return datetime.strptime(str(s).strip(), "%d.%m.%Y")
-    except ValueError:
+        day, month, year = s.split('.')
+        if not (len(day) <= 2 and len(month) <= 2 and len(year) == 4 and s.isascii()
+                and day.isdigit() and month.isdigit() and year.isdigit()):
+            return None
+        return datetime(int(year), int(month), int(day))
+    except (ValueError, OverflowError):
         return None
 
 
-def month_label(dt):
-    return f"{MONTH_NAMES[dt.month]} {dt.year}"
+@lru_cache(maxsize=64)
+def month_label(year, month):
+    return f"{MONTH_NAMES[month]} {year}"
 
 
+@lru_cache(maxsize=64)
 def month_sort_key(ml):
     parts = ml.split()
     return (int(parts[1]), MONTH_NAME_TO_NUM[parts[0]])
 
 
+def parse_month_name(v):
+    """Lowercase month name of a cell value, or None if it isn't one."""
+    mn = MONTH_LOOKUP.get(v)
+    if mn is None and v:
+        mn = str(v).strip().lower()
+        if mn not in MONTH_NAME_TO_NUM:
+            return None
+    return mn
+
+
 def find_sheet(wb, name):
+    """Return the rows of a sheet matched by name (case/space-insensitive), or None."""
     if name in wb.sheetnames:
-        return wb[name]
+        return wb.sheet_rows(name)
     for sn in wb.sheetnames:
         if sn.strip().lower() == name.strip().lower():
-            return wb[sn]
+            return wb.sheet_rows(sn)
     return None
 
 
 # === OPERATIONAL DATA PARSING ===
 
-def detect_block_columns(ws, header_row):
-    """Detect column layout from a block's header row.
+def detect_block_columns(header):
+    """Detect column layout from a block's header row (tuple of cell values).
 
     Returns list of field names, one per column offset from the date start.
     The stride = len(field_list).
     """
     fields = []
-    for c in range(2, min(ws.max_column + 1, 200)):
-        v = ws.cell(header_row, c).value
+    for v in header[1:199]:
         if v is None:
             break
         h = str(v).strip().lower()
@@ -219,42 +350,66 @@ def detect_block_columns(ws, header_row):
     return result
 
 
-def parse_ops_sheet(wb, sheet_name, config):
-    ws = find_sheet(wb, sheet_name)
-    if not ws:
+def parse_ops_sheet(wb, sheet_name, config, cols):
+    """Append a sheet's daily records to the DAILY_FIELDS column lists in cols.
+
+    Returns the number of records added.
+    """
+    rows = find_sheet(wb, sheet_name)
+    if rows is None:
         print(f"  WARNING: Sheet '{sheet_name}' not found")
-        return []
+        return 0
 
+    max_row = len(rows)
+    max_col = len(rows[0]) if rows else 0
     subgroups = config['subgroups']
     group = config['group']
-    daily_records = []
+    count = 0
+    add_e, add_sg, add_g, add_d, add_m = (cols[k].append for k in ('e', 'sg', 'g', 'd', 'm'))
+    add_nums = [cols[f].append for f in SUM_FIELDS]
+    # Blocks in a sheet almost always share one header row; detect each layout once
+    layouts = {}
 
     # Find all block boundaries ("Сотрудники" in col A)
-    block_starts = []
-    for r in range(1, ws.max_row + 1):
-        v = ws.cell(r, 1).value
-        if v and str(v).strip() == 'Сотрудники':
-            block_starts.append(r)
+    block_starts = [r for r, v in enumerate((row[0] for row in rows), 1)
+                    if isinstance(v, str) and v.strip() == 'Сотрудники']
 
     for bi, bs in enumerate(block_starts):
         date_row = bs + 2
         data_start = bs + 4
-        block_end = block_starts[bi + 1] - 1 if bi + 1 < len(block_starts) else ws.max_row
+        block_end = block_starts[bi + 1] - 1 if bi + 1 < len(block_starts) else max_row
 
-        # Validate: first date cell must parse
-        if not parse_date(ws.cell(date_row, 2).value):
+        if date_row > max_row:
             continue
+        date_cells = rows[date_row - 1]
 
-        # Detect column layout for this block
-        fields = detect_block_columns(ws, bs)
-        stride = len(fields)
+        # Validate: first date cell must parse
+        if max_col < 2 or not parse_date(date_cells[1]):
+            continue
 
-        # Collect dates
+        # Detect column layout for this block, keyed by the header cells it reads
+        header = rows[bs - 1]
+        key = tuple(header[1:199])
+        layout = layouts.get(key)
+        if layout is None:
+            fields = detect_block_columns(header)
+            # (column offset, record slot, converter); _zni and unknown columns are skipped
+            readers = [
+                (offset, SUM_SLOT[field], safe_tzt if field == 'tzt' else safe_int)
+                for offset, field in enumerate(fields) if field in SUM_SLOT
+            ]
+            # vz counts as ts_r only when there is no dedicated ts_r column
+            vz_as_tsr = 'ts_r' not in fields
+            layout = layouts[key] = (len(fields), readers, vz_as_tsr)
+        stride, readers, vz_as_tsr = layout
+
+        # Collect dates as (0-based first column, day string, month label)
         dates = []
-        for c in range(2, ws.max_column + 1, stride):
-            dt = parse_date(ws.cell(date_row, c).value)
+        for c in range(2, max_col + 1, stride):
+            dt = parse_date(date_cells[c - 1])
             if dt:
-                dates.append((c, dt))
+                day = f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+                dates.append((c - 1, day, month_label(dt.year, dt.month)))
         if not dates:
             continue
 
@@ -262,9 +417,10 @@ def parse_ops_sheet(wb, sheet_name, config):
         # In гамма-1, subgroups are separated by blank/Итого/Беклог rows.
         # First subgroup (Гамма-1) has no trailing Итого — just a blank row before next.
         sg_idx = 0
+        last_sg = len(subgroups) - 1
         in_gap = False
-        for r in range(data_start, block_end + 1):
-            name_val = ws.cell(r, 1).value
+        for row in rows[data_start - 1:block_end]:
+            name_val = row[0]
             if not name_val:
                 in_gap = True
                 continue
@@ -276,47 +432,75 @@ def parse_ops_sheet(wb, sheet_name, config):
                 continue
 
             # Employee row: advance subgroup if we were in a gap
-            if in_gap and sg_idx < len(subgroups) - 1:
+            if in_gap and sg_idx < last_sg:
                 sg_idx += 1
             in_gap = False
 
-            sg = subgroups[min(sg_idx, len(subgroups) - 1)]
-
-            for col_start, dt in dates:
-                rec = {
-                    'e': name, 'sg': sg, 'g': group,
-                    'd': dt.strftime('%Y-%m-%d'),
-                    'm': month_label(dt),
-                    'tzt': 0.0, 'tk_b': 0, 'ts_b': 0,
-                    'tk_r': 0, 'ts_r': 0, 'vz': 0,
-                }
-                for offset, field in enumerate(fields):
-                    val = ws.cell(r, col_start + offset).value
-                    if field == 'tzt':
-                        rec['tzt'] = round(safe_float(val), 2)
-                    elif field == 'vz':
-                        v = safe_int(val)
-                        rec['vz'] = v
-                        if 'ts_r' not in fields:
-                            rec['ts_r'] = v  # count as ts_r only when no dedicated ts_r column
-                    elif field in ('tk_b', 'ts_b', 'tk_r', 'ts_r'):
-                        rec[field] = safe_int(val)
-                    # _zni (when separate ts_r exists) and unknowns are skipped
-                daily_records.append(rec)
-
-    return daily_records
+            sg = subgroups[min(sg_idx, last_sg)]
+
+            for base, day, ml in dates:
+                rec = [0.0, 0, 0, 0, 0, 0]  # SUM_FIELDS order
+                for offset, slot, conv in readers:
+                    # Cells past the sheet edge keep the zero default, same as empty ones
+                    if base + offset < max_col:
+                        rec[slot] = conv(row[base + offset])
+                if vz_as_tsr:
+                    rec[TS_R_SLOT] = rec[VZ_SLOT]
+                add_e(name)
+                add_sg(sg)
+                add_g(group)
+                add_d(day)
+                add_m(ml)
+                for add, v in zip(add_nums, rec):
+                    add(v)
+                count += 1
+
+    return count
+
+
+def pack_daily(cols):
+    """Convert daily column lists to compact arrays when NumPy/pandas are available.
+
+    Numeric columns become NumPy arrays (int64, so a stray ID or phone number
+    in a count cell still fits; float64 for tzt), string columns pandas
+    Categoricals. Without them the plain lists are kept.
+    """
+    packed = {}
+    for k, v in cols.items():
+        if k == 'tzt' and np is not None:
+            packed[k] = np.asarray(v, dtype=np.float64)
+        elif k in SUM_SLOT and np is not None:
+            packed[k] = np.asarray(v, dtype=np.int64)
+        elif k not in SUM_SLOT and pd is not None:
+            packed[k] = pd.Categorical(v)
+        else:
+            packed[k] = v
+    return packed
+
+
+def as_list(col):
+    """Plain Python list of a daily column (array, Categorical or list)."""
+    return col.tolist() if hasattr(col, 'tolist') else col
+
+
+def daily_table(daily):
+    """Daily data in its JSON layout: field names once, then one value array per record."""
+    fields = list(daily)
+    return {'fields': fields, 'rows': list(zip(*(as_list(daily[k]) for k in fields)))}
 
 
 def parse_all_ops(ops_path):
     print(f"Parsing: {os.path.basename(ops_path)}")
     wb = safe_load_workbook(ops_path)
-    all_daily = []
-    for sheet_name, config in SHEET_CONFIG.items():
-        records = parse_ops_sheet(wb, sheet_name, config)
-        print(f"  {sheet_name}: {len(records)} daily records")
-        all_daily.extend(records)
-    print(f"  Total: {len(all_daily)} daily records")
-    return all_daily
+    cols = {f: [] for f in DAILY_FIELDS}
+    try:
+        for sheet_name, config in SHEET_CONFIG.items():
+            count = parse_ops_sheet(wb, sheet_name, config, cols)
+            print(f"  {sheet_name}: {count} daily records")
+    finally:
+        wb.close()
+    print(f"  Total: {len(cols['e'])} daily records")
+    return pack_daily(cols)
 
 
 # === AGGREGATION ===
@@ -324,9 +508,9 @@ def parse_all_ops(ops_path):
 def build_hierarchy(daily):
     sg_employees = defaultdict(set)
     sg_to_group = {}
-    for r in daily:
-        sg_employees[r['sg']].add(r['e'])
-        sg_to_group[r['sg']] = r['g']
+    for sg, e, g in zip(daily['sg'], daily['e'], daily['g']):
+        sg_employees[sg].add(e)
+        sg_to_group[sg] = g
 
     hierarchy = {}
     group_map = {}
@@ -351,88 +535,218 @@ def build_hierarchy(daily):
 
 
 def compute_months(daily):
-    months = sorted(set(r['m'] for r in daily), key=month_sort_key)
+    months = sorted(dict.fromkeys(daily['m']), key=month_sort_key)
     mo_map = {m: i + 1 for i, m in enumerate(months)}
     return months, mo_map
 
 
 def aggregate(daily, ops_mo_map):
-    emp_agg = defaultdict(lambda: {
-        'tzt': 0.0, 'tk_b': 0, 'ts_b': 0, 'tk_r': 0, 'ts_r': 0, 'vz': 0,
-    })
+    if pd is not None:
+        return aggregate_pandas(daily, ops_mo_map)
+    if _jit_accumulate() is not None:
+        sums = accumulate_numba(daily)
+    else:
+        sums = accumulate_python(daily)
+    return monthly_rows(*sums, ops_mo_map)
+
+
+def accumulate_python(daily):
+    """Sum daily records per (employee, subgroup, month) and (subgroup, month).
+
+    Returns (emp_agg, emp_meta, sg_agg, sg_meta). Sums are lists in
+    SUM_FIELDS order; sg_agg lists also end with the number of distinct
+    employees and days. The meta dicts map each key to its group.
+    """
+    emp_agg = {}
     emp_meta = {}
-    sg_agg = defaultdict(lambda: {
-        'tzt': 0.0, 'tk_b': 0, 'ts_b': 0, 'tk_r': 0, 'ts_r': 0, 'vz': 0,
-        'employees': set(), 'dates': set(),
-    })
+    sg_agg = {}
     sg_meta = {}
+    emp_get = emp_agg.__getitem__
+    sg_get = sg_agg.__getitem__
 
-    for r in daily:
-        ek = (r['e'], r['sg'], r['m'])
-        d = emp_agg[ek]
-        d['tzt'] += r['tzt']
-        d['tk_b'] += r['tk_b']
-        d['ts_b'] += r['ts_b']
-        d['tk_r'] += r['tk_r']
-        d['ts_r'] += r['ts_r']
-        d['vz'] += r['vz']
-        emp_meta[ek] = r['g']
-
-        sk = (r['sg'], r['m'])
-        s = sg_agg[sk]
-        s['tzt'] += r['tzt']
-        s['tk_b'] += r['tk_b']
-        s['ts_b'] += r['ts_b']
-        s['tk_r'] += r['tk_r']
-        s['ts_r'] += r['ts_r']
-        s['vz'] += r['vz']
-        s['employees'].add(r['e'])
-        s['dates'].add(r['d'])
-        sg_meta[sk] = r['g']
-
+    columns = (as_list(daily[k]) for k in DAILY_FIELDS)
+    for e, sg, g, day, m, tzt, tk_b, ts_b, tk_r, ts_r, vz in zip(*columns):
+        ek = (e, sg, m)
+        try:
+            d = emp_get(ek)
+        except KeyError:
+            d = emp_agg[ek] = [0.0, 0, 0, 0, 0, 0]
+        d[0] += tzt
+        d[1] += tk_b
+        d[2] += ts_b
+        d[3] += tk_r
+        d[4] += ts_r
+        d[5] += vz
+        emp_meta[ek] = g
+
+        sk = (sg, m)
+        try:
+            s = sg_get(sk)
+        except KeyError:
+            s = sg_agg[sk] = [0.0, 0, 0, 0, 0, 0, set(), set()]
+        s[0] += tzt
+        s[1] += tk_b
+        s[2] += ts_b
+        s[3] += tk_r
+        s[4] += ts_r
+        s[5] += vz
+        s[6].add(e)
+        s[7].add(day)
+        sg_meta[sk] = g
+
+    for s in sg_agg.values():
+        s[6] = len(s[6])
+        s[7] = len(s[7])
+    return emp_agg, emp_meta, sg_agg, sg_meta
+
+
+def _accumulate(ids, tzt, counts, out_tzt, out_counts, out_last):
+    """Add each record's tzt/counts to its key's row; out_last gets the last record index."""
+    for i in range(ids.size):
+        k = ids[i]
+        out_tzt[k] += tzt[i]
+        for j in range(counts.shape[1]):
+            out_counts[k, j] += counts[i, j]
+        out_last[k] = i
+
+
+@lru_cache(maxsize=None)
+def _jit_accumulate():
+    """_accumulate compiled with Numba, or None if numba is not installed.
+
+    Imported on first use: numba is only needed when pandas is missing and
+    takes a noticeable time to import.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(_accumulate)
+
+
+def _factorize(values):
+    """Integer codes (in sorted-value order) for a column, plus the number of distinct values."""
+    uniques, codes = np.unique(np.asarray(values), return_inverse=True)
+    return codes, uniques.size
+
+
+def accumulate_numba(daily):
+    """accumulate_python() with keys encoded as ints and the sums JIT-compiled."""
+    e, sg, g, day, m = (as_list(daily[k]) for k in ('e', 'sg', 'g', 'd', 'm'))
+    e_code, n_e = _factorize(e)
+    sg_code, n_sg = _factorize(sg)
+    m_code, n_m = _factorize(m)
+    d_code, n_d = _factorize(day)
+    tzt = np.asarray(daily['tzt'], dtype=np.float64)
+    counts = np.column_stack([np.asarray(daily[f], dtype=np.int64) for f in SUM_FIELDS[1:]])
+
+    def sums(key_code):
+        keys, ids = np.unique(key_code, return_inverse=True)
+        out_tzt = np.zeros(keys.size)
+        out_counts = np.zeros((keys.size, counts.shape[1]), dtype=np.int64)
+        out_last = np.zeros(keys.size, dtype=np.int64)
+        _jit_accumulate()(ids, tzt, counts, out_tzt, out_counts, out_last)
+        return ids, out_tzt.tolist(), out_counts.tolist(), out_last.tolist()
+
+    def distinct_per_key(ids, code, n_code, n_keys):
+        pairs = np.unique(ids * n_code + code)
+        return np.bincount(pairs // n_code, minlength=n_keys).tolist()
+
+    emp_agg, emp_meta = {}, {}
+    _, emp_tzt, emp_counts, emp_last = sums((e_code * n_sg + sg_code) * n_m + m_code)
+    for t, c, i in zip(emp_tzt, emp_counts, emp_last):
+        ek = (e[i], sg[i], m[i])
+        emp_agg[ek] = [t, *c]
+        emp_meta[ek] = g[i]
+
+    sg_agg, sg_meta = {}, {}
+    sg_ids, sg_tzt, sg_counts, sg_last = sums(sg_code * n_m + m_code)
+    employees = distinct_per_key(sg_ids, e_code, n_e, len(sg_last))
+    days = distinct_per_key(sg_ids, d_code, n_d, len(sg_last))
+    for t, c, i, num_emp, num_days in zip(sg_tzt, sg_counts, sg_last, employees, days):
+        sk = (sg[i], m[i])
+        sg_agg[sk] = [t, *c, num_emp, num_days]
+        sg_meta[sk] = g[i]
+
+    return emp_agg, emp_meta, sg_agg, sg_meta
+
+
+def monthly_rows(emp_agg, emp_meta, sg_agg, sg_meta, ops_mo_map):
+    """Build emp_monthly / sg_monthly records (with util and tph_*) from the sums."""
     # Employee monthly
     emp_monthly = []
-    for (emp, sg, month), d in sorted(emp_agg.items()):
-        tzt = round(d['tzt'], 1)
+    for (emp, sg, month), (tzt, tk_b, ts_b, tk_r, ts_r, vz) in sorted(emp_agg.items()):
+        tzt = round(tzt, 1)
         norm = PROD_CALENDAR.get(month, 21) * 8
         util = round(tzt / norm * 100, 1) if norm > 0 else 0
-        tph_b = round(d['tk_b'] / tzt, 4) if tzt > 0 else 0
-        tph_z = round(d['ts_b'] / tzt, 4) if tzt > 0 else 0
-        tph_all = round((d['tk_b'] + d['ts_b']) / tzt, 4) if tzt > 0 else 0
+        tph_b = round(tk_b / tzt, 4) if tzt > 0 else 0
+        tph_z = round(ts_b / tzt, 4) if tzt > 0 else 0
+        tph_all = round((tk_b + ts_b) / tzt, 4) if tzt > 0 else 0
         emp_monthly.append({
             'employee': emp, 'subgroup': sg, 'group': emp_meta[(emp, sg, month)],
             'month': month, 'month_order': ops_mo_map[month],
             'tzt': tzt, 'norm': norm, 'util': util,
-            'tk_b': d['tk_b'], 'ts_b': d['ts_b'],
-            'tk_r': d['tk_r'], 'ts_r': d['ts_r'],
+            'tk_b': tk_b, 'ts_b': ts_b,
+            'tk_r': tk_r, 'ts_r': ts_r,
             'tph_b': tph_b, 'tph_z': tph_z, 'tph_all': tph_all,
-            'vz': d['vz'],
+            'vz': vz,
         })
 
     # Subgroup monthly
     sg_monthly = []
-    for (sg, month), s in sorted(sg_agg.items()):
-        num_emp = len(s['employees'])
-        tzt = round(s['tzt'], 1)
+    for (sg, month), (tzt, tk_b, ts_b, tk_r, ts_r, vz, num_emp, num_days) in sorted(sg_agg.items()):
+        tzt = round(tzt, 1)
         norm = PROD_CALENDAR.get(month, 21) * 8 * num_emp
         util = round(tzt / norm * 100, 1) if norm > 0 else 0
-        tph_b = round(s['tk_b'] / tzt, 4) if tzt > 0 else 0
-        tph_z = round(s['ts_b'] / tzt, 4) if tzt > 0 else 0
-        tph_all = round((s['tk_b'] + s['ts_b']) / tzt, 4) if tzt > 0 else 0
+        tph_b = round(tk_b / tzt, 4) if tzt > 0 else 0
+        tph_z = round(ts_b / tzt, 4) if tzt > 0 else 0
+        tph_all = round((tk_b + ts_b) / tzt, 4) if tzt > 0 else 0
         sg_monthly.append({
             'subgroup': sg, 'group': sg_meta[(sg, month)],
             'month': month, 'month_order': ops_mo_map[month],
             'tzt': tzt, 'norm': norm, 'util': util,
-            'tk_b': s['tk_b'], 'ts_b': s['ts_b'],
-            'tk_r': s['tk_r'], 'ts_r': s['ts_r'],
-            'employees': num_emp, 'days': len(s['dates']),
+            'tk_b': tk_b, 'ts_b': ts_b,
+            'tk_r': tk_r, 'ts_r': ts_r,
+            'employees': num_emp, 'days': num_days,
             'tph_b': tph_b, 'tph_z': tph_z, 'tph_all': tph_all,
-            'vz': s['vz'],
+            'vz': vz,
         })
 
     return emp_monthly, sg_monthly
 
 
+def aggregate_pandas(daily, ops_mo_map):
+    """accumulate_python() with the per-record loop done by groupby, then monthly_rows().
+
+    tzt is summed with np.bincount, which adds in record order like the loop;
+    groupby's compensated sum can land on the other side of a .x5 rounding tie.
+    """
+    df = pd.DataFrame({k: daily[k] for k in DAILY_FIELDS})
+    tzt = df['tzt'].to_numpy()
+    counts = {f: (f, 'sum') for f in SUM_FIELDS[1:]}
+
+    def sums(keys, **extra):
+        gb = df.groupby(keys, sort=True, observed=True)
+        out = gb.agg(g=('g', 'last'), **counts, **extra).reset_index()
+        out['tzt'] = np.bincount(gb.ngroup().to_numpy(), weights=tzt, minlength=gb.ngroups)
+        return out
+
+    emp = sums(['e', 'sg', 'm'])
+    emp_agg, emp_meta = {}, {}
+    for e, sg, m, g, *c in zip(*(emp[k].tolist() for k in ['e', 'sg', 'm', 'g'] + SUM_FIELDS)):
+        emp_agg[(e, sg, m)] = c
+        emp_meta[(e, sg, m)] = g
+
+    sg_sums = sums(['sg', 'm'], employees=('e', 'nunique'), days=('d', 'nunique'))
+    sg_agg, sg_meta = {}, {}
+    columns = ['sg', 'm', 'g'] + SUM_FIELDS + ['employees', 'days']
+    for sg, m, g, *c in zip(*(sg_sums[k].tolist() for k in columns)):
+        sg_agg[(sg, m)] = c
+        sg_meta[(sg, m)] = g
+
+    return monthly_rows(emp_agg, emp_meta, sg_agg, sg_meta, ops_mo_map)
+
+
 # === CLIENT DATA PARSING ===
 
 def infer_month_years(month_names):
@@ -452,24 +766,19 @@ def infer_month_years(month_names):
 
 
 def parse_cl_tzt(wb):
-    ws = wb['данные тзт']
+    rows = wb.sheet_rows('данные тзт')
     results = []
     canonical_clients = {}  # lowercase → canonical name
 
-    for r in range(2, ws.max_row + 1):
-        client = ws.cell(r, 1).value
-        month_name = ws.cell(r, 2).value
-        year = ws.cell(r, 3).value
-        team = ws.cell(r, 4).value
-        tzt_type = ws.cell(r, 5).value
-        tzt = ws.cell(r, 6).value
+    for row in rows[1:]:
+        client, month_name, year, team, tzt_type, tzt = (*row[:6], *(None,) * (6 - len(row)))
 
         if not client or not month_name:
             continue
 
         client = str(client).strip()
         canonical_clients[client.lower()] = client
-        month_name = str(month_name).strip().lower()
+        month_name = MONTH_LOOKUP.get(month_name) or str(month_name).strip().lower()
         year = int(year) if year else 2025
         team = str(team).strip() if team else ''
         tzt_type = str(tzt_type).strip() if tzt_type else 'операционка'
@@ -504,37 +813,57 @@ def normalize_client(name, canonical_map):
     return name
 
 
-def parse_cl_tickets(wb, sheet_name, ticket_type, canonical_clients):
+def client_namer(canonical_map):
+    """Memoized raw client cell → canonical name ('' for blank cells).
+
+    The same client appears on every pivot sheet, so one namer is shared
+    by all of them.
+    """
+    names = {}
+
+    def client_name(raw):
+        try:
+            return names[raw]
+        except KeyError:
+            name = str(raw).strip()
+            name = names[raw] = normalize_client(name, canonical_map) if name else ''
+            return name
+
+    return client_name
+
+
+def header_months(header):
+    """(column, month name, month label) for the month cells of a pivot header row."""
+    months = []
+    for c, v in enumerate(header[1:], start=2):
+        mn = parse_month_name(v)
+        if mn:
+            months.append((c, mn))
+    month_years = infer_month_years([m for _, m in months])
+    return [(c, mn, f"{mn} {month_years.get(mn, 2025)}") for c, mn in months]
+
+
+def parse_cl_tickets(wb, sheet_name, ticket_type, client_name):
     """Parse заявки or задачи sheet (pivot format: months × поступило/решено)."""
-    ws = wb[sheet_name]
+    rows = wb.sheet_rows(sheet_name)
     results = []
 
     # Row 1: month names at even columns
-    months = []
-    for c in range(2, ws.max_column + 1):
-        v = ws.cell(1, c).value
-        if v and str(v).strip().lower() in MONTH_NAME_TO_NUM:
-            months.append((c, str(v).strip().lower()))
+    max_col = len(rows[0]) if rows else 0
+    months = header_months(rows[0]) if rows else []
 
     if not months:
         return results
 
-    month_years = infer_month_years([m for _, m in months])
-    # Stride = distance between month columns
-    stride = months[1][0] - months[0][0] if len(months) >= 2 else 2
-
     # Data starts at row 3
-    for r in range(3, ws.max_row + 1):
-        client = ws.cell(r, 1).value
-        if not client or not str(client).strip():
+    for row in rows[2:]:
+        client = row[0] and client_name(row[0])
+        if not client:
             continue
-        client = normalize_client(str(client).strip(), canonical_clients)
 
-        for col_start, mn in months:
-            year = month_years.get(mn, 2025)
-            ml = f"{mn} {year}"
-            incoming = safe_int(ws.cell(r, col_start).value)
-            resolved = safe_int(ws.cell(r, col_start + 1).value)
+        for col_start, mn, ml in months:
+            incoming = safe_int(row[col_start - 1])
+            resolved = safe_int(row[col_start] if col_start < max_col else None)
             results.append({
                 'client': client, 'month': mn, 'ml': ml,
                 'type': ticket_type,
@@ -544,33 +873,24 @@ def parse_cl_tickets(wb, sheet_name, ticket_type, canonical_clients):
     return results
 
 
-def parse_cl_sla(wb, canonical_clients):
-    ws = wb['sla']
+def parse_cl_sla(wb, client_name):
+    rows = wb.sheet_rows('sla')
     results = []
 
-    months = []
-    for c in range(2, ws.max_column + 1):
-        v = ws.cell(1, c).value
-        if v and str(v).strip().lower() in MONTH_NAME_TO_NUM:
-            months.append((c, str(v).strip().lower()))
+    max_col = len(rows[0]) if rows else 0
+    months = header_months(rows[0]) if rows else []
 
     if not months:
         return results
 
-    month_years = infer_month_years([m for _, m in months])
-    stride = months[1][0] - months[0][0] if len(months) >= 2 else 2
-
-    for r in range(3, ws.max_row + 1):
-        client = ws.cell(r, 1).value
-        if not client or not str(client).strip():
+    for row in rows[2:]:
+        client = row[0] and client_name(row[0])
+        if not client:
             continue
-        client = normalize_client(str(client).strip(), canonical_clients)
 
-        for col_start, mn in months:
-            year = month_years.get(mn, 2025)
-            ml = f"{mn} {year}"
-            sr_raw = ws.cell(r, col_start).value
-            si_raw = ws.cell(r, col_start + 1).value
+        for col_start, mn, ml in months:
+            sr_raw = row[col_start - 1]
+            si_raw = row[col_start] if col_start < max_col else None
             sr = safe_float(sr_raw) if sr_raw and str(sr_raw).strip() != '-' else None
             si = safe_float(si_raw) if si_raw and str(si_raw).strip() != '-' else None
             results.append({
@@ -581,33 +901,24 @@ def parse_cl_sla(wb, canonical_clients):
     return results
 
 
-def parse_cl_mass(wb, canonical_clients):
-    ws = wb['массовые']
+def parse_cl_mass(wb, client_name):
+    rows = wb.sheet_rows('массовые')
     results = []
 
     # Row 1: month names, 1 column per month
-    months = []
-    for c in range(2, ws.max_column + 1):
-        v = ws.cell(1, c).value
-        if v and str(v).strip().lower() in MONTH_NAME_TO_NUM:
-            months.append((c, str(v).strip().lower()))
+    months = header_months(rows[0]) if rows else []
 
     if not months:
         return results
 
-    month_years = infer_month_years([m for _, m in months])
-
     # Data starts at row 2 (no sub-header row)
-    for r in range(2, ws.max_row + 1):
-        client = ws.cell(r, 1).value
-        if not client or not str(client).strip():
+    for row in rows[1:]:
+        client = row[0] and client_name(row[0])
+        if not client:
             continue
-        client = normalize_client(str(client).strip(), canonical_clients)
 
-        for col, mn in months:
-            year = month_years.get(mn, 2025)
-            ml = f"{mn} {year}"
-            mi = safe_int(ws.cell(r, col).value)
+        for col, mn, ml in months:
+            mi = safe_int(row[col - 1])
             results.append({
                 'client': client, 'month': mn, 'ml': ml, 'mi': mi,
             })
@@ -618,42 +929,87 @@ def parse_cl_mass(wb, canonical_clients):
 def parse_all_client(client_path):
     print(f"Parsing: {os.path.basename(client_path)}")
     wb = safe_load_workbook(client_path)
+    try:
+        cl_tzt, canonical_clients = parse_cl_tzt(wb)
+        print(f"  данные тзт: {len(cl_tzt)} records")
+        client_name = client_namer(canonical_clients)
 
-    cl_tzt, canonical_clients = parse_cl_tzt(wb)
-    print(f"  данные тзт: {len(cl_tzt)} records")
-
-    cl_tickets = parse_cl_tickets(wb, 'заявки', 'заявки', canonical_clients)
-    cl_tasks = parse_cl_tickets(wb, 'задачи', 'задачи', canonical_clients)
-    cl_all_tickets = cl_tickets + cl_tasks
-    print(f"  заявки: {len(cl_tickets)}, задачи: {len(cl_tasks)}")
+        cl_tickets = parse_cl_tickets(wb, 'заявки', 'заявки', client_name)
+        cl_tasks = parse_cl_tickets(wb, 'задачи', 'задачи', client_name)
+        cl_all_tickets = cl_tickets + cl_tasks
+        print(f"  заявки: {len(cl_tickets)}, задачи: {len(cl_tasks)}")
 
-    cl_sla = parse_cl_sla(wb, canonical_clients)
-    print(f"  sla: {len(cl_sla)} records")
+        cl_sla = parse_cl_sla(wb, client_name)
+        print(f"  sla: {len(cl_sla)} records")
 
-    cl_mass = parse_cl_mass(wb, canonical_clients)
-    print(f"  массовые: {len(cl_mass)} records")
+        cl_mass = parse_cl_mass(wb, client_name)
+        print(f"  массовые: {len(cl_mass)} records")
+    finally:
+        wb.close()
 
     return cl_tzt, cl_all_tickets, cl_sla, cl_mass
 
 
 # === BUILD ===
 
+# Parsed workbooks: path → (mtime, parser result). In watch mode only the
+# workbook whose mtime moved is parsed again.
+_parse_cache = {}
+
+
+def parse_workbooks(jobs):
+    """Run {path: parser} jobs, reusing cached results for unchanged files.
+
+    Several stale workbooks are parsed at once in separate processes
+    (parsing is CPU-bound); a single one is parsed in-process.
+    """
+    results = {}
+    stale = {}
+    for path, parser in jobs.items():
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            # Briefly missing (e.g. replaced during sync): parse it, and let
+            # safe_load_workbook's retries wait for the file to come back
+            mtime = None
+        cached = _parse_cache.get(path)
+        if mtime is not None and cached and cached[0] == mtime:
+            print(f"Unchanged: {os.path.basename(path)} (reusing parsed data)")
+            results[path] = cached[1]
+        else:
+            stale[path] = mtime
+
+    if len(stale) > 1:
+        with ProcessPoolExecutor(max_workers=len(stale)) as ex:
+            futures = {path: ex.submit(jobs[path], path) for path in stale}
+            for path, future in futures.items():
+                results[path] = future.result()
+    else:
+        for path in stale:
+            results[path] = jobs[path](path)
+
+    for path, mtime in stale.items():
+        if mtime is not None:
+            _parse_cache[path] = (mtime, results[path])
+    return results
+
+
 def build_data():
+    parsed = parse_workbooks({OPS_EXCEL: parse_all_ops, CLIENT_EXCEL: parse_all_client})
+    daily = parsed[OPS_EXCEL]
+    cl_tzt, cl_tickets, cl_sla, cl_mass = parsed[CLIENT_EXCEL]
+
     # 1. Operational data
-    daily = parse_all_ops(OPS_EXCEL)
     hierarchy, group_map, sg_to_group = build_hierarchy(daily)
     months_ops, ops_mo_map = compute_months(daily)
 
-    for r in daily:
-        r['mo'] = ops_mo_map[r['m']]
+    mo = [ops_mo_map[m] for m in daily['m']]
+    daily['mo'] = np.asarray(mo, dtype=np.int32) if np is not None else mo
 
     emp_monthly, sg_monthly = aggregate(daily, ops_mo_map)
 
-    # 2. Client data
-    cl_tzt, cl_tickets, cl_sla, cl_mass = parse_all_client(CLIENT_EXCEL)
-
-    # Client month ordering
-    cl_months = sorted(set(r['ml'] for r in cl_tzt), key=month_sort_key)
+    # 2. Client data: month ordering
+    cl_months = sorted(dict.fromkeys(r['ml'] for r in cl_tzt), key=month_sort_key)
     cl_mo_map = {m: i + 1 for i, m in enumerate(cl_months)}
 
     for dataset in (cl_tzt, cl_tickets, cl_sla, cl_mass):
@@ -661,15 +1017,14 @@ def build_data():
             r['mo'] = cl_mo_map.get(r['ml'], 0)
 
     # Clients: collect from ALL client data sources (some clients appear only in tickets/sla)
-    all_client_names = set(r['client'] for r in cl_tzt)
-    all_client_names |= set(r['client'] for r in cl_tickets)
-    all_client_names |= set(r['client'] for r in cl_sla)
-    all_client_names |= set(r['client'] for r in cl_mass)
+    all_client_names = dict.fromkeys(
+        r['client'] for r in chain(cl_tzt, cl_tickets, cl_sla, cl_mass)
+    )
     clients = sorted(all_client_names)
-    teams_cl = sorted(set(r['team'] for r in cl_tzt))
+    teams_cl = sorted(dict.fromkeys(r['team'] for r in cl_tzt))
 
     # 3. Production calendar for all relevant months
-    all_months = sorted(set(months_ops) | set(cl_months), key=month_sort_key)
+    all_months = sorted(dict.fromkeys(chain(months_ops, cl_months)), key=month_sort_key)
     prod_cal = {m: PROD_CALENDAR.get(m, 21) for m in all_months}
 
     # 4. Assemble
@@ -692,7 +1047,7 @@ def build_data():
     }
 
     print(f"\nData summary:")
-    print(f"  {len(daily)} daily, {len(emp_monthly)} emp_monthly, {len(sg_monthly)} sg_monthly")
+    print(f"  {len(daily['e'])} daily, {len(emp_monthly)} emp_monthly, {len(sg_monthly)} sg_monthly")
     print(f"  {len(cl_tzt)} cl_tzt, {len(cl_tickets)} cl_tickets, {len(cl_sla)} cl_sla, {len(cl_mass)} cl_mass")
     print(f"  Ops months: {months_ops}")
     print(f"  Client months: {cl_months}")
@@ -702,24 +1057,24 @@ def build_data():
     return data
 
 
+def encode_json(data):
+    """Serialize data to compact UTF-8 JSON bytes (orjson, or stdlib json as fallback)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
 def write_json(data):
-    with open(JSON_OUTPUT, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
-    size_kb = os.path.getsize(JSON_OUTPUT) / 1024
-    print(f"JSON: {JSON_OUTPUT} ({size_kb:.0f} KB)")
-
-
-def build_html():
-    with open(CSS_PATH, 'r', encoding='utf-8') as f:
-        css = f.read()
-    with open(BODY_PATH, 'r', encoding='utf-8') as f:
-        body = f.read()
-    with open(JS_PATH, 'r', encoding='utf-8') as f:
-        js = f.read()
-    with open(JSON_OUTPUT, 'r', encoding='utf-8') as f:
-        data_json = f.read()
-
-    html = f"""<!DOCTYPE html>
+    """Write v3_data.json and return its bytes (embedded as-is by build_html)."""
+    # daily is the largest dataset: emit it as a table instead of repeating keys per record
+    data_json = encode_json({**data, 'daily': daily_table(data['daily'])})
+    with open(JSON_OUTPUT, 'wb', buffering=IO_BUFFER) as f:
+        f.write(data_json)
+    print(f"JSON: {JSON_OUTPUT} ({len(data_json) / 1024:.0f} KB)")
+    return data_json
+
+
+HTML_HEAD = """<!DOCTYPE html>
 <html lang="ru">
 <head>
 <meta charset="UTF-8">
@@ -731,18 +1086,28 @@ def build_html():
 <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
 <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
 <style>
-{css}
-</style>
-</head>
-{body}
-<script>
-const D = {data_json};
-{js}
-</script>
-</html>"""
-
-    with open(HTML_OUTPUT, 'w', encoding='utf-8') as f:
-        f.write(html)
+""".encode('utf-8')
+
+
+def _append_file(out, path):
+    with open(path, 'rb') as f:
+        shutil.copyfileobj(f, out, IO_BUFFER)
+
+
+def build_html(data_json):
+    """Assemble the dashboard around data_json (the bytes of v3_data.json)."""
+    # Components are streamed into the output as raw UTF-8 bytes, so the
+    # page is never held in memory as one string.
+    with open(HTML_OUTPUT, 'wb', buffering=IO_BUFFER) as out:
+        out.write(HTML_HEAD)
+        _append_file(out, CSS_PATH)
+        out.write(b'\n</style>\n</head>\n')
+        _append_file(out, BODY_PATH)
+        out.write(b'\n<script>\nconst D = ')
+        out.write(data_json)
+        out.write(b';\n')
+        _append_file(out, JS_PATH)
+        out.write(b'\n</script>\n</html>')
     size_kb = os.path.getsize(HTML_OUTPUT) / 1024
     print(f"HTML: {HTML_OUTPUT} ({size_kb:.0f} KB)")
 
@@ -796,15 +1161,72 @@ def deploy_github():
 def build():
     start = time.time()
     data = build_data()
-    write_json(data)
-    build_html()
+    data_json = write_json(data)
+    build_html(data_json)
     copy_to_leaders()
     deploy_github()
     elapsed = time.time() - start
     print(f"\nBuild complete in {elapsed:.1f}s")
 
 
-def watch(interval=30):
+def rebuild_after_change():
+    print(f"\n{'=' * 60}")
+    print(f"Change detected at {datetime.now().strftime('%H:%M:%S')}")
+    print(f"{'=' * 60}")
+    try:
+        build()
+    except Exception as e:
+        print(f"Build error: {e}")
+
+
+def watch(interval=None):
+    """Rebuild on source changes: file-system events if watchdog is installed, else polling."""
+    if Observer is not None:
+        watch_events(2 if interval is None else interval)
+    else:
+        watch_poll(30 if interval is None else interval)
+
+
+def watch_events(debounce):
+    files = {os.path.abspath(f) for f in (OPS_EXCEL, CLIENT_EXCEL)}
+    print(f"Watching {len(files)} files (file events, debounce: {debounce}s)")
+    print("Press Ctrl+C to stop\n")
+
+    build()
+
+    changed = threading.Event()
+
+    class SourceChangeHandler(FileSystemEventHandler):
+        # Only writes count: our own reads emit opened/closed_no_write events
+        WRITE_EVENTS = {'modified', 'created', 'moved', 'closed'}
+
+        def on_any_event(self, event):
+            if event.is_directory or event.event_type not in self.WRITE_EVENTS:
+                return
+            paths = {event.src_path, getattr(event, 'dest_path', '')}
+            if any(p and os.path.abspath(p) in files for p in paths):
+                changed.set()
+
+    observer = Observer()
+    for d in {os.path.dirname(f) for f in files}:
+        observer.schedule(SourceChangeHandler(), d, recursive=False)
+    observer.start()
+    try:
+        while True:
+            changed.wait()
+            # OneDrive writes in bursts: rebuild once the files are quiet for `debounce` s
+            changed.clear()
+            while changed.wait(debounce):
+                changed.clear()
+            rebuild_after_change()
+    except KeyboardInterrupt:
+        print("\nStopped.")
+    finally:
+        observer.stop()
+        observer.join()
+
+
+def watch_poll(interval):
     files = [OPS_EXCEL, CLIENT_EXCEL]
     print(f"Watching {len(files)} files (interval: {interval}s)")
     print("Press Ctrl+C to stop\n")
@@ -832,13 +1254,7 @@ def watch(interval=30):
                     continue
 
             if changed:
-                print(f"\n{'=' * 60}")
-                print(f"Change detected at {datetime.now().strftime('%H:%M:%S')}")
-                print(f"{'=' * 60}")
-                try:
-                    build()
-                except Exception as e:
-                    print(f"Build error: {e}")
+                rebuild_after_change()
 
         except KeyboardInterrupt:
             print("\nStopped.")
@@ -848,7 +1264,8 @@ def watch(interval=30):
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Teams & Customers Dashboard Builder')
     parser.add_argument('--watch', '-w', action='store_true', help='Watch for file changes')
-    parser.add_argument('--interval', '-i', type=int, default=30, help='Watch interval (seconds)')
+    parser.add_argument('--interval', '-i', type=int, default=None,
+                        help='Watch debounce with watchdog (default 2s), else poll interval (default 30s)')
     args = parser.parse_args()
 
     for f in [OPS_EXCEL, CLIENT_EXCEL]: